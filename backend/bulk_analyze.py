@@ -0,0 +1,296 @@
+"""Offline bulk resume analysis.
+
+Runs the same pipeline as POST /api/analyze over a directory of resumes and
+one or more job postings, without the HTTP layer or MongoDB:
+
+    python bulk_analyze.py resumes/ -j backend_swe.txt -j data_eng.txt -o results.jsonl
+
+Each resume is parsed by the same sandboxed parse_worker.py child the API
+uses, driven from a small thread pool. LLM calls run with bounded concurrency,
+and every result is appended to the output (.jsonl or .csv) as soon as it is
+ready. Re-run with --resume to skip resume/posting pairs already written; failed
+and half-written rows from the earlier run are dropped and retried.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# server.py reads these at import time; the bulk run never touches the database
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'bulk_analyze')
+
+from fastapi import HTTPException  # noqa: E402
+import server  # noqa: E402
+from server import (  # noqa: E402
+    extract_text_from_pdf,
+    extract_text_from_docx,
+    analyze_with_openai,
+    generate_mock_analysis,
+    score_to_level,
+    PARSE_MAX_CONCURRENCY,
+)
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.doc')
+CSV_FIELDS = [
+    'file', 'posting', 'score', 'level', 'source', 'reaction',
+    'keywords_found', 'keywords_missing', 'suggestions', 'error',
+]
+
+
+def find_resumes(root: Path) -> list:
+    """All supported resume files under root, in a stable order"""
+    return sorted(p for p in root.rglob('*') if p.is_file() and p.suffix.lower() in RESUME_EXTENSIONS)
+
+
+def parse_resume(path: str) -> Tuple[str, Optional[str], Optional[str], float]:
+    """Extract text from one resume. Runs in the parse thread pool."""
+    started = time.monotonic()
+    try:
+        file_content = Path(path).read_bytes()
+        if path.lower().endswith('.pdf'):
+            text = extract_text_from_pdf(file_content)
+        else:
+            text = extract_text_from_docx(file_content)
+        if not text or len(text) < 50:
+            return path, None, "Could not extract sufficient text from resume", time.monotonic() - started
+        return path, text, None, time.monotonic() - started
+    except HTTPException as e:
+        return path, None, e.detail, time.monotonic() - started
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}", time.monotonic() - started
+
+
+async def analyze(resume_text: str, job_description: str, use_llm: bool) -> Dict[str, Any]:
+    """OpenAI analysis with mock fallback, same as the API route"""
+    analysis_data = await analyze_with_openai(resume_text, job_description) if use_llm else None
+    source = 'llm'
+    if not analysis_data:
+        analysis_data = generate_mock_analysis(resume_text, job_description)
+        source = 'mock'
+
+    score = analysis_data.get('score', 50)
+    return {
+        'score': score,
+        'level': analysis_data.get('level') or score_to_level(score),
+        'source': source,
+        'reaction': analysis_data.get('reaction', 'Analysis complete'),
+        'feedback': analysis_data.get('feedback', []),
+        'suggestions': analysis_data.get('suggestions', []),
+        'keywords_found': analysis_data.get('keywords_found', []),
+        'keywords_missing': analysis_data.get('keywords_missing', []),
+    }
+
+
+class ResultWriter:
+    """Appends results to JSONL or CSV, flushing after every row"""
+
+    def __init__(self, path: Path, append: bool):
+        self.path = path
+        self.is_csv = path.suffix.lower() == '.csv'
+        write_header = not (append and path.exists() and path.stat().st_size > 0)
+        self.handle = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        if self.is_csv:
+            self.csv = csv.DictWriter(self.handle, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            if write_header:
+                self.csv.writeheader()
+
+    def write(self, record: Dict[str, Any]):
+        if self.is_csv:
+            row = dict(record)
+            for key in ('keywords_found', 'keywords_missing', 'suggestions'):
+                row[key] = '; '.join(str(item) for item in row.get(key) or [])
+            # One row per line keeps --resume able to drop a half-written row
+            row = {key: ' '.join(value.splitlines()) if isinstance(value, str) else value
+                   for key, value in row.items()}
+            self.csv.writerow(row)
+        else:
+            self.handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.handle.flush()
+
+    def close(self):
+        self.handle.close()
+
+
+def read_rows(path: Path) -> List[Dict[str, Any]]:
+    """Complete rows of an earlier run, skipping any a killed run cut off"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.suffix.lower() == '.csv':
+            # DictReader pads short rows with None and files extras under None
+            return [row for row in csv.DictReader(f) if None not in row and None not in row.values()]
+        rows = []
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+        return rows
+
+
+def is_success(row: Dict[str, Any]) -> bool:
+    return bool(row.get('file') and row.get('level') and not row.get('error'))
+
+
+def load_checkpoint(path: Path) -> Set[Tuple[str, str]]:
+    """(file, posting) pairs that already have a successful result"""
+    if not path.exists():
+        return set()
+    return {(row['file'], row['posting']) for row in read_rows(path) if is_success(row)}
+
+
+def compact_output(path: Path):
+    """Rewrite an earlier run's output keeping only successful rows, so retried
+    pairs don't end up with both an error row and a result row"""
+    rows = [row for row in read_rows(path) if is_success(row)]
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        if path.suffix.lower() == '.csv':
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    os.replace(tmp_path, path)
+
+
+def load_postings(paths: list) -> Dict[str, str]:
+    """Job posting texts keyed by file stem, which must be unique"""
+    postings = {}
+    for p in paths:
+        stem = Path(p).stem
+        if stem in postings:
+            raise ValueError(f"Duplicate job posting name '{stem}': {p}")
+        postings[stem] = Path(p).read_text(encoding='utf-8')
+    return postings
+
+
+async def run(args, postings: Dict[str, str]) -> Dict[str, Any]:
+    root = Path(args.resumes_dir)
+    output = Path(args.output)
+
+    done = set()
+    if args.resume and output.exists():
+        compact_output(output)
+        done = load_checkpoint(output)
+
+    # run_parse_worker holds a server-wide slot per child; size it to --workers for this run
+    server.PARSE_SLOTS = threading.BoundedSemaphore(args.workers)
+
+    queue = asyncio.Queue()
+    skipped = 0
+    for path in find_resumes(root):
+        name = str(path.relative_to(root))
+        pending = [posting for posting in postings if (name, posting) not in done]
+        skipped += len(postings) - len(pending)
+        if pending:
+            queue.put_nowait((path, name, pending))
+
+    stats = {
+        'resumes': queue.qsize(), 'parsed': 0, 'parse_failed': 0, 'parse_seconds': 0.0,
+        'analyses': 0, 'analysis_failed': 0, 'llm': 0, 'mock': 0, 'skipped': skipped,
+    }
+    writer = ResultWriter(output, append=args.resume)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def analyze_pair(name: str, posting: str, resume_text: str):
+        try:
+            async with semaphore:
+                result = await analyze(resume_text, postings[posting], use_llm=not args.no_llm)
+            writer.write({'file': name, 'posting': posting, **result, 'error': None})
+        except Exception as e:
+            stats['analysis_failed'] += 1
+            logging.warning(f"Analysis failed for {name} / {posting}: {e}")
+            writer.write({'file': name, 'posting': posting, 'error': f"{type(e).__name__}: {e}"})
+            return
+        stats['analyses'] += 1
+        stats[result['source']] += 1
+
+    async def handle_resume(path: Path, name: str, pending: list, pool: ThreadPoolExecutor):
+        _, text, error, seconds = await loop.run_in_executor(pool, parse_resume, str(path))
+        stats['parse_seconds'] += seconds
+        if error:
+            stats['parse_failed'] += 1
+            logging.warning(f"Skipping {name}: {error}")
+            for posting in pending:
+                writer.write({'file': name, 'posting': posting, 'error': error})
+            return
+        stats['parsed'] += 1
+        await asyncio.gather(*(analyze_pair(name, posting, text) for posting in pending))
+
+    async def consume(pool: ThreadPoolExecutor):
+        # A fixed set of consumers keeps only a handful of parsed resumes in memory
+        while not queue.empty():
+            path, name, pending = queue.get_nowait()
+            await handle_resume(path, name, pending, pool)
+
+    started = time.monotonic()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            await asyncio.gather(*(consume(pool) for _ in range(args.workers + args.concurrency)))
+    finally:
+        writer.close()
+    stats['elapsed_seconds'] = time.monotonic() - started
+    return stats
+
+
+def print_summary(stats: Dict[str, Any]):
+    elapsed = stats['elapsed_seconds'] or 1e-9
+    print(f"Resumes:   {stats['resumes']} queued, {stats['parsed']} parsed, "
+          f"{stats['parse_failed']} failed, {stats['skipped']} pairs skipped from checkpoint")
+    print(f"Analyses:  {stats['analyses']} ({stats['llm']} LLM, {stats['mock']} mock fallback), "
+          f"{stats['analysis_failed']} failed")
+    if stats['parsed'] + stats['parse_failed']:
+        avg_parse = stats['parse_seconds'] / (stats['parsed'] + stats['parse_failed'])
+        print(f"Parsing:   {avg_parse:.2f}s avg per resume")
+    print(f"Elapsed:   {elapsed:.1f}s, {stats['resumes'] / elapsed:.2f} resumes/s, "
+          f"{stats['analyses'] * 60 / elapsed:.1f} analyses/min")
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Score a directory of resumes against job postings")
+    parser.add_argument('resumes_dir', help="Directory searched recursively for PDF/DOC/DOCX resumes")
+    parser.add_argument('-j', '--job-description', action='append', required=True,
+                        help="Job posting text file; repeat for several postings (file names must differ)")
+    parser.add_argument('-o', '--output', default='results.jsonl', help="Output file, .jsonl or .csv")
+    parser.add_argument('--workers', type=positive_int, default=PARSE_MAX_CONCURRENCY,
+                        help="Parallel sandboxed parse processes (overrides PARSE_MAX_CONCURRENCY)")
+    parser.add_argument('--concurrency', type=positive_int, default=8, help="Max in-flight LLM calls")
+    parser.add_argument('--resume', action='store_true',
+                        help="Skip pairs already done in the output file; failed pairs are dropped and retried")
+    parser.add_argument('--no-llm', action='store_true', help="Use mock analysis only")
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+    if not Path(args.resumes_dir).is_dir():
+        parser.error(f"resumes_dir is not a directory: {args.resumes_dir}")
+    try:
+        postings = load_postings(args.job_description)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s', force=True)
+    stats = asyncio.run(run(args, postings))
+    print_summary(stats)
+
+
+if __name__ == '__main__':
+    main()
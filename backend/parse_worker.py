@@ -0,0 +1,95 @@
+"""Isolated resume text extraction.
+
+Runs as a child process of server.py so a hostile upload can only take down
+this worker. The document bytes arrive on stdin, a JSON result goes to stdout.
+
+Usage: parse_worker.py <pdf|docx> <cpu_seconds> <memory_mb> <max_chars> <max_uncompressed_mb>
+"""
+import io
+import json
+import resource
+import sys
+import zipfile
+
+# Exit codes understood by server.run_parse_worker
+EXIT_OK = 0
+EXIT_INVALID = 2
+EXIT_LIMIT = 3
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+def apply_limits(cpu_seconds: int, memory_mb: int):
+    """Cap CPU time and address space for this process"""
+    # Soft limit sends SIGXCPU, hard limit one second later sends SIGKILL
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    memory_bytes = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+
+def extract_pdf(file_content: bytes) -> str:
+    """Extract text from PDF file"""
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def check_zip_bomb(file_content: bytes, max_uncompressed_mb: int):
+    """Reject DOCX archives that would inflate past the allowed size"""
+    with zipfile.ZipFile(io.BytesIO(file_content)) as archive:
+        total = sum(info.file_size for info in archive.infolist())
+    if total > max_uncompressed_mb * 1024 * 1024:
+        raise LimitExceeded(f"DOCX expands to {total} bytes")
+
+
+def extract_docx(file_content: bytes, max_uncompressed_mb: int) -> str:
+    """Extract text from DOCX file"""
+    check_zip_bomb(file_content, max_uncompressed_mb)
+
+    import docx
+    doc = docx.Document(io.BytesIO(file_content))
+    text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+    return text.strip()
+
+
+def emit(payload: dict, code: int):
+    sys.stdout.write(json.dumps(payload, ensure_ascii=False))
+    sys.stdout.flush()
+    sys.exit(code)
+
+
+def main(argv: list) -> None:
+    kind = argv[1]
+    cpu_seconds, memory_mb, max_chars, max_uncompressed_mb = (int(arg) for arg in argv[2:6])
+
+    apply_limits(cpu_seconds, memory_mb)
+    file_content = sys.stdin.buffer.read()
+
+    try:
+        if kind == "pdf":
+            text = extract_pdf(file_content)
+        elif kind == "docx":
+            text = extract_docx(file_content, max_uncompressed_mb)
+        else:
+            emit({"error": f"Unknown document type: {kind}"}, EXIT_INVALID)
+    except (LimitExceeded, MemoryError, RecursionError) as e:
+        emit({"error": f"{type(e).__name__}: {e}"}, EXIT_LIMIT)
+    except Exception as e:
+        emit({"error": f"{type(e).__name__}: {e}"}, EXIT_INVALID)
+
+    truncated = len(text) > max_chars
+    emit({
+        "text": text[:max_chars],
+        "truncated": truncated,
+    }, EXIT_OK)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -10,11 +10,16 @@ from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone
 from emergentintegrations.llm.chat import LlmChat, UserMessage
-import PyPDF2
-import docx
-import io
 import re
 import json
+import sys
+import time
+import asyncio
+import threading
+import signal
+import contextlib
+import subprocess
+from parse_worker import EXIT_OK, EXIT_LIMIT
 
 
 ROOT_DIR = Path(__file__).parent
@@ -25,6 +30,16 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Document parsing runs in a resource-limited child process (see parse_worker.py)
+PARSE_WORKER = ROOT_DIR / 'parse_worker.py'
+PARSE_TIMEOUT_SECONDS = float(os.environ.get('PARSE_TIMEOUT_SECONDS', '20'))
+PARSE_CPU_SECONDS = int(os.environ.get('PARSE_CPU_SECONDS', '10'))
+PARSE_MEMORY_MB = int(os.environ.get('PARSE_MEMORY_MB', '512'))
+PARSE_MAX_OUTPUT_CHARS = int(os.environ.get('PARSE_MAX_OUTPUT_CHARS', '200000'))
+PARSE_MAX_UNCOMPRESSED_MB = int(os.environ.get('PARSE_MAX_UNCOMPRESSED_MB', '50'))
+PARSE_MAX_CONCURRENCY = int(os.environ.get('PARSE_MAX_CONCURRENCY', '4'))
+PARSE_SLOTS = threading.BoundedSemaphore(PARSE_MAX_CONCURRENCY)
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -70,30 +85,102 @@ class AnalysisHistory(BaseModel):
 
 
 # Utility functions
+def run_parse_worker(file_content: bytes, kind: str) -> str:
+    """Extract text in an isolated child process with CPU, memory and size limits"""
+    label = kind.upper()
+    cmd = [
+        sys.executable, str(PARSE_WORKER), kind,
+        str(PARSE_CPU_SECONDS), str(PARSE_MEMORY_MB),
+        str(PARSE_MAX_OUTPUT_CHARS), str(PARSE_MAX_UNCOMPRESSED_MB),
+    ]
+    # Worst case is every char JSON-escaped to \uXXXX, plus the result envelope
+    max_output_bytes = PARSE_MAX_OUTPUT_CHARS * 6 + 65536
+
+    with PARSE_SLOTS:
+        started = time.monotonic()
+        # stderr is discarded so a chatty parser can't grow this process; errors come back in the JSON
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(PARSE_TIMEOUT_SECONDS, kill_on_timeout)
+        timer.start()
+        finished = False
+        oversized = False
+        try:
+            try:
+                proc.stdin.write(file_content)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            stdout = proc.stdout.read(max_output_bytes + 1)
+            oversized = len(stdout) > max_output_bytes
+            if oversized:
+                proc.kill()
+            # Wait for exit without reaping, so the timer can't signal a recycled pid
+            os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+            finished = True
+        finally:
+            timer.cancel()
+            timer.join()
+            if not finished:
+                proc.kill()
+            for pipe in (proc.stdin, proc.stdout):
+                with contextlib.suppress(OSError):
+                    pipe.close()
+            # wait4 reaps the child and returns its own rusage, including for killed parses
+            _, status, rusage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+
+    usage = {
+        "wall_seconds": round(time.monotonic() - started, 3),
+        "cpu_seconds": round(rusage.ru_utime + rusage.ru_stime, 3),
+        "max_rss_kb": rusage.ru_maxrss,
+    }
+    logging.info(f"{label} parse: exit={proc.returncode} usage={usage} bytes={len(file_content)}")
+
+    # The timer may fire just after a normal exit; only a SIGKILLed child really timed out
+    if timed_out.is_set() and proc.returncode == -signal.SIGKILL:
+        logging.warning(f"{label} parse killed: exceeded {PARSE_TIMEOUT_SECONDS}s wall clock")
+        raise HTTPException(status_code=422, detail=f"{label} took too long to process")
+
+    if oversized:
+        logging.warning(f"{label} parse produced oversized output (over {max_output_bytes} bytes)")
+        raise HTTPException(status_code=422, detail=f"{label} is too expensive to process")
+
+    # Signal exit means the kernel enforced a limit (SIGXCPU / SIGKILL on CPU time)
+    if proc.returncode < 0:
+        logging.warning(f"{label} parse killed by signal {-proc.returncode}")
+        raise HTTPException(status_code=422, detail=f"{label} is too expensive to process")
+
+    try:
+        payload = json.loads(stdout)
+    except ValueError:
+        payload = {"error": "Worker returned no result"}
+
+    if proc.returncode == EXIT_LIMIT:
+        logging.warning(f"{label} parse hit resource limit: {payload.get('error')}")
+        raise HTTPException(status_code=422, detail=f"{label} is too expensive to process")
+    if proc.returncode != EXIT_OK:
+        logging.error(f"Error extracting {label}: {payload.get('error')}")
+        raise HTTPException(status_code=400, detail=f"Failed to extract text from {label}")
+
+    if payload.get("truncated"):
+        logging.info(f"{label} text truncated to {PARSE_MAX_OUTPUT_CHARS} chars")
+    return payload["text"]
+
+
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from PDF file"""
-    try:
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        logging.error(f"Error extracting PDF: {e}")
-        raise HTTPException(status_code=400, detail="Failed to extract text from PDF")
+    return run_parse_worker(file_content, "pdf")
 
 
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from DOCX file"""
-    try:
-        doc_file = io.BytesIO(file_content)
-        doc = docx.Document(doc_file)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
-    except Exception as e:
-        logging.error(f"Error extracting DOCX: {e}")
-        raise HTTPException(status_code=400, detail="Failed to extract text from DOCX")
+    return run_parse_worker(file_content, "docx")
 
 
 def extract_keywords(text: str) -> List[str]:
@@ -114,6 +201,17 @@ def extract_keywords(text: str) -> List[str]:
     return [k[0] for k in sorted_keywords[:20]]
 
 
+def score_to_level(score: int) -> str:
+    """Map a cooked score to its level"""
+    if score <= 30:
+        return 'safe'
+    elif score <= 60:
+        return 'warning'
+    elif score <= 80:
+        return 'cooked'
+    return 'burnt'
+
+
 async def analyze_with_openai(resume_text: str, job_description: str) -> Dict[str, Any]:
     """Analyze resume using OpenAI via emergentintegrations"""
     try:
@@ -293,10 +391,11 @@ async def analyze_resume(
         file_content = await resume.read()
         
         # Extract text based on file type
+        # Parsing blocks on a child process, keep it off the event loop
         if filename.endswith('.pdf'):
-            resume_text = extract_text_from_pdf(file_content)
+            resume_text = await asyncio.to_thread(extract_text_from_pdf, file_content)
         else:
-            resume_text = extract_text_from_docx(file_content)
+            resume_text = await asyncio.to_thread(extract_text_from_docx, file_content)
         
         if not resume_text or len(resume_text) < 50:
             raise HTTPException(status_code=400, detail="Could not extract sufficient text from resume")
@@ -312,14 +411,7 @@ async def analyze_resume(
         # Determine level if not provided
         score = analysis_data.get('score', 50)
         if 'level' not in analysis_data:
-            if score <= 30:
-                analysis_data['level'] = 'safe'
-            elif score <= 60:
-                analysis_data['level'] = 'warning'
-            elif score <= 80:
-                analysis_data['level'] = 'cooked'
-            else:
-                analysis_data['level'] = 'burnt'
+            analysis_data['level'] = score_to_level(score)
         
         # Create result object
         result = AnalysisResult(
@@ -0,0 +1,182 @@
+import asyncio
+import csv
+import json
+
+import pytest
+
+bulk_analyze = pytest.importorskip("bulk_analyze")
+
+
+def test_find_resumes(tmp_path):
+    (tmp_path / "sub").mkdir()
+    for name in ("b.pdf", "a.DOCX", "sub/c.doc", "notes.txt", "image.png"):
+        (tmp_path / name).write_bytes(b"x")
+    found = [str(p.relative_to(tmp_path)) for p in bulk_analyze.find_resumes(tmp_path)]
+    assert found == ["a.DOCX", "b.pdf", "sub/c.doc"]
+
+
+def test_result_writer_jsonl(tmp_path):
+    output = tmp_path / "out.jsonl"
+    writer = bulk_analyze.ResultWriter(output, append=False)
+    writer.write({"file": "a.pdf", "posting": "swe", "score": 70, "level": "cooked", "error": None})
+    writer.close()
+    writer = bulk_analyze.ResultWriter(output, append=True)
+    writer.write({"file": "b.pdf", "posting": "swe", "error": "broken"})
+    writer.close()
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["file"] for row in rows] == ["a.pdf", "b.pdf"]
+    assert rows[0]["level"] == "cooked"
+
+
+def test_result_writer_csv(tmp_path):
+    output = tmp_path / "out.csv"
+    writer = bulk_analyze.ResultWriter(output, append=False)
+    writer.write({"file": "a.pdf", "posting": "swe", "score": 70, "level": "cooked",
+                  "suggestions": ["add numbers", 3], "feedback": [{"x": 1}], "error": None})
+    writer.close()
+    writer = bulk_analyze.ResultWriter(output, append=True)
+    writer.write({"file": "b.pdf", "posting": "swe", "error": "broken"})
+    writer.close()
+
+    rows = list(csv.DictReader(output.open()))
+    assert len(rows) == 2
+    assert rows[0]["suggestions"] == "add numbers; 3"
+    assert rows[1]["error"] == "broken"
+
+
+def test_load_checkpoint_skips_errors(tmp_path):
+    output = tmp_path / "out.jsonl"
+    output.write_text(
+        json.dumps({"file": "a.pdf", "posting": "swe", "level": "safe", "error": None}) + "\n"
+        + json.dumps({"file": "b.pdf", "posting": "swe", "error": "broken"}) + "\n"
+    )
+    assert bulk_analyze.load_checkpoint(output) == {("a.pdf", "swe")}
+
+
+def test_load_checkpoint_csv_skips_errors(tmp_path):
+    output = tmp_path / "out.csv"
+    writer = bulk_analyze.ResultWriter(output, append=False)
+    writer.write({"file": "a.pdf", "posting": "swe", "score": 10, "level": "safe", "error": None})
+    writer.write({"file": "b.pdf", "posting": "swe", "error": "broken"})
+    writer.close()
+    assert bulk_analyze.load_checkpoint(output) == {("a.pdf", "swe")}
+
+
+def test_cut_off_line_is_dropped(tmp_path):
+    output = tmp_path / "out.jsonl"
+    full = json.dumps({"file": "a.pdf", "posting": "swe", "level": "safe", "error": None}) + "\n"
+    output.write_text(full + '{"file": "b.pdf", "posti')
+
+    assert bulk_analyze.load_checkpoint(output) == {("a.pdf", "swe")}
+
+    bulk_analyze.compact_output(output)
+    assert output.read_text() == full
+
+
+def test_compact_output_drops_error_rows(tmp_path):
+    output = tmp_path / "out.jsonl"
+    ok = json.dumps({"file": "a.pdf", "posting": "swe", "level": "safe", "error": None}) + "\n"
+    output.write_text(ok + json.dumps({"file": "b.pdf", "posting": "swe", "error": "broken"}) + "\n")
+
+    bulk_analyze.compact_output(output)
+    assert output.read_text() == ok
+
+
+def test_csv_multiline_cell_cut_off_and_resumed(tmp_path):
+    output = tmp_path / "out.csv"
+    writer = bulk_analyze.ResultWriter(output, append=False)
+    writer.write({"file": "a.pdf", "posting": "swe", "score": 10, "level": "safe",
+                  "reaction": "line1\nline2", "suggestions": ["one\ntwo"], "error": None})
+    writer.write({"file": "b.pdf", "posting": "swe", "score": 90, "level": "burnt",
+                  "reaction": "first\nsecond", "error": None})
+    writer.close()
+    text = output.read_text()
+    assert len(text.splitlines()) == 3
+    # Simulate a run killed partway through the second row
+    output.write_text(text[:text.index("first") + 3])
+
+    bulk_analyze.compact_output(output)
+    assert bulk_analyze.load_checkpoint(output) == {("a.pdf", "swe")}
+
+    writer = bulk_analyze.ResultWriter(output, append=True)
+    writer.write({"file": "b.pdf", "posting": "swe", "score": 90, "level": "burnt", "error": None})
+    writer.close()
+
+    rows = list(csv.DictReader(output.open()))
+    assert [row["file"] for row in rows] == ["a.pdf", "b.pdf"]
+    assert rows[0]["reaction"] == "line1 line2"
+    assert bulk_analyze.load_checkpoint(output) == {("a.pdf", "swe"), ("b.pdf", "swe")}
+
+
+def test_duplicate_posting_names_rejected(tmp_path):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "swe.txt").write_text("python")
+    with pytest.raises(ValueError):
+        bulk_analyze.load_postings([str(tmp_path / "a/swe.txt"), str(tmp_path / "b/swe.txt")])
+
+
+def run_cli(argv):
+    args = bulk_analyze.build_parser().parse_args(argv)
+    postings = bulk_analyze.load_postings(args.job_description)
+    return asyncio.run(bulk_analyze.run(args, postings))
+
+
+@pytest.mark.parametrize("flag", ["--workers", "--concurrency"])
+def test_non_positive_limits_rejected(flag):
+    with pytest.raises(SystemExit):
+        bulk_analyze.build_parser().parse_args(["resumes", "-j", "swe.txt", flag, "0"])
+
+
+def test_run_no_llm_writes_error_rows(tmp_path):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "broken.docx").write_bytes(b"not a zip")
+    jd = tmp_path / "swe.txt"
+    jd.write_text("Python engineer with AWS and Kubernetes experience")
+    output = tmp_path / "out.jsonl"
+
+    stats = run_cli([str(resumes), "-j", str(jd), "-o", str(output), "--no-llm"])
+
+    assert stats["parse_failed"] == 1
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert rows == [{"file": "broken.docx", "posting": "swe", "error": "Failed to extract text from DOCX"}]
+
+
+def test_run_no_llm_and_resume(tmp_path, make_docx):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    text = "Senior Python engineer who built AWS services and Kubernetes tooling for five years."
+    for name in ("a.docx", "b.docx"):
+        (resumes / name).write_bytes(make_docx(text))
+    jd = tmp_path / "swe.txt"
+    jd.write_text("Python engineer with AWS and Kubernetes experience")
+    output = tmp_path / "out.csv"
+    argv = [str(resumes), "-j", str(jd), "-o", str(output), "--no-llm"]
+
+    stats = run_cli(argv)
+    assert stats["analyses"] == 2 and stats["mock"] == 2
+    rows = list(csv.DictReader(output.open()))
+    assert {row["file"] for row in rows} == {"a.docx", "b.docx"}
+    assert all(row["source"] == "mock" and row["level"] for row in rows)
+
+    stats = run_cli(argv + ["--resume"])
+    assert stats["skipped"] == 2 and stats["analyses"] == 0
+    assert len(list(csv.DictReader(output.open()))) == 2
+
+
+def test_resume_retries_failed_pairs_without_duplicates(tmp_path):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "broken.docx").write_bytes(b"not a zip")
+    jd = tmp_path / "swe.txt"
+    jd.write_text("Python engineer")
+    output = tmp_path / "out.jsonl"
+    argv = [str(resumes), "-j", str(jd), "-o", str(output), "--no-llm"]
+
+    run_cli(argv)
+    stats = run_cli(argv + ["--resume"])
+
+    assert stats["parse_failed"] == 1
+    assert len(output.read_text().splitlines()) == 1
@@ -0,0 +1,74 @@
+import io
+import json
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+import parse_worker
+from parse_worker import EXIT_INVALID, EXIT_LIMIT, EXIT_OK
+
+WORKER = parse_worker.__file__
+
+
+def run_worker(kind, file_content, max_chars=1000, max_uncompressed_mb=50):
+    cmd = [sys.executable, WORKER, kind, "10", "512", str(max_chars), str(max_uncompressed_mb)]
+    proc = subprocess.run(cmd, input=file_content, capture_output=True, timeout=60)
+    return proc.returncode, json.loads(proc.stdout)
+
+
+def zip_bomb(size_mb=60):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", b"0" * (size_mb * 1024 * 1024))
+    return buffer.getvalue()
+
+
+def test_zip_bomb_hits_limit():
+    code, payload = run_worker("docx", zip_bomb())
+    assert code == EXIT_LIMIT
+    assert "expands to" in payload["error"]
+
+
+def test_non_zip_docx_is_invalid():
+    code, payload = run_worker("docx", b"definitely not a zip file")
+    assert code == EXIT_INVALID
+    assert "BadZipFile" in payload["error"]
+
+
+def test_unknown_kind_is_invalid():
+    code, _ = run_worker("xls", b"whatever")
+    assert code == EXIT_INVALID
+
+
+def test_output_truncated_at_max_chars(make_docx):
+    code, payload = run_worker("docx", make_docx("x" * 500), max_chars=100)
+    assert code == EXIT_OK
+    assert payload["text"] == "x" * 100
+    assert payload["truncated"] is True
+
+
+@pytest.fixture
+def server():
+    return pytest.importorskip("server")
+
+
+def test_run_parse_worker_zip_bomb_is_422(server):
+    with pytest.raises(server.HTTPException) as exc:
+        server.run_parse_worker(zip_bomb(), "docx")
+    assert exc.value.status_code == 422
+
+
+def test_run_parse_worker_corrupt_file_is_400(server):
+    with pytest.raises(server.HTTPException) as exc:
+        server.run_parse_worker(b"definitely not a zip file", "docx")
+    assert exc.value.status_code == 400
+
+
+def test_run_parse_worker_timeout_is_422(server, monkeypatch):
+    monkeypatch.setattr(server, "PARSE_TIMEOUT_SECONDS", 0.001)
+    with pytest.raises(server.HTTPException) as exc:
+        server.run_parse_worker(zip_bomb(), "docx")
+    assert exc.value.status_code == 422
+    assert "too long" in exc.value.detail